@@ -1,16 +1,198 @@
 import os
+import sys
+import errno
 import json
 import shutil
 import random
+import time
 import uuid
+import itertools
+import hashlib
+import queue
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import pygame
 import keyboard
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog
 from tkinter.ttk import Treeview
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+try:
+    import evdev
+except ImportError:
+    evdev = None
+
 CONFIG_FILE = "soundboard_config.json"
 SOUNDS_FOLDER = "sounds"
+# 256 samples is ~5.8 ms per mixer callback at 44.1 kHz, half of 512, at the cost of more
+# underrun risk on slow machines. Override with "mixer_buffer" in the config file.
+DEFAULT_MIXER_BUFFER = 256
+MIXER_CHANNELS = 32
+SOUND_CACHE_SIZE = 128
+PRELOAD_WORKERS = 4
+HOTKEY_MODIFIERS = ("ctrl", "shift", "alt", "windows")
+_MODIFIER_ALIASES = {"control": "ctrl", "option": "alt", "win": "windows", "cmd": "windows", "command": "windows"}
+# keyboard-library key names whose evdev KEY_* names aren't just the name uppercased without spaces.
+_EVDEV_KEY_ALIASES = {
+    "ctrl": ("LEFTCTRL", "RIGHTCTRL"), "shift": ("LEFTSHIFT", "RIGHTSHIFT"), "alt": ("LEFTALT", "RIGHTALT"),
+    "windows": ("LEFTMETA", "RIGHTMETA"), "left windows": ("LEFTMETA",), "right windows": ("RIGHTMETA",),
+    "alt gr": ("RIGHTALT",), "return": ("ENTER",), "escape": ("ESC",), "del": ("DELETE",), "print screen": ("SYSRQ",),
+    "-": ("MINUS",), "=": ("EQUAL",), "[": ("LEFTBRACE",), "]": ("RIGHTBRACE",), ";": ("SEMICOLON",),
+    "'": ("APOSTROPHE",), "`": ("GRAVE",), "\\": ("BACKSLASH",), ".": ("DOT",), "/": ("SLASH",),
+}
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# path -> (file stamp, volume, Sound at that volume, full-volume Sound), least recently used first.
+_sound_cache = OrderedDict()
+_sound_cache_lock = threading.Lock()
+
+
+def _json_dumps(obj):
+    """Serialize obj to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _file_digest(path):
+    """Hash a file's contents in 1 MiB chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _evdev_key_to_codes(name):
+    """Resolve a keyboard-library key name to evdev key codes, without keyboard's root-only tables."""
+    names = _EVDEV_KEY_ALIASES.get(name) or (name.upper().replace(" ", ""),)
+    codes = [evdev.ecodes.ecodes[f"KEY_{n}"] for n in names if f"KEY_{n}" in evdev.ecodes.ecodes]
+    if not codes:
+        raise ValueError(f"Key '{name}' is not mapped to any known key.")
+    return codes
+
+
+def _decode_sound(path):
+    """Decode an audio file into a Sound, using pydub for mp3s this SDL_mixer build can't read."""
+    try:
+        return pygame.mixer.Sound(path)
+    except pygame.error:
+        if AudioSegment is None or os.path.splitext(path)[1].lower() != '.mp3':
+            raise
+
+    frequency, _, channels = pygame.mixer.get_init()
+    try:
+        segment = AudioSegment.from_mp3(path)
+        segment = segment.set_frame_rate(frequency).set_channels(channels).set_sample_width(2)
+    except Exception as e:
+        raise pygame.error(f"Could not decode '{path}': {e}")
+    return pygame.mixer.Sound(buffer=segment.raw_data)
+
+
+def _file_stamp(path):
+    """Identify a file's current contents cheaply, to tell when a cached decode is stale."""
+    st = os.stat(path)
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _forget_sounds(paths):
+    """Drop the cache entries for paths, e.g. when their files are deleted and the names may be reused."""
+    with _sound_cache_lock:
+        for path in paths:
+            _sound_cache.pop(path, None)
+
+
+def _forget_stale_sound(path):
+    """Drop path's cache entry if the file changed on disk since it was decoded."""
+    with _sound_cache_lock:
+        entry = _sound_cache.get(path)
+    if entry is None:
+        return
+    try:
+        stamp = _file_stamp(path)
+    except OSError:
+        stamp = None
+    if stamp != entry[0]:
+        with _sound_cache_lock:
+            if _sound_cache.get(path) is entry:
+                del _sound_cache[path]
+
+
+def _scale_sound(base, volume):
+    """Return the full-volume Sound base at the given volume.
+
+    With numpy available the volume is baked into a new Sound's samples, so playback skips set_volume.
+    Without it base itself is returned with its volume set; the cache never hands out two volumes of one path.
+    """
+    if numpy is None:
+        base.set_volume(volume)
+        return base
+    if volume == 1.0:
+        return base
+    samples = pygame.sndarray.array(base)
+    return pygame.sndarray.make_sound((samples * volume).astype(samples.dtype))
+
+
+def _get_sound(path, volume):
+    """Return path's Sound at the given volume, decoded on first use and kept in a bounded LRU cache.
+
+    The cache holds one entry per path: the full-volume Sound and the Sound scaled to the last volume
+    asked for, so a volume change rescales from memory instead of decoding the file again.
+    """
+    with _sound_cache_lock:
+        entry = _sound_cache.get(path)
+        if entry is not None:
+            _sound_cache.move_to_end(path)
+            if entry[1] == volume:
+                return entry[2]
+    if entry is not None:
+        stamp, base = entry[0], entry[3]
+    else:
+        stamp = _file_stamp(path)
+        base = _decode_sound(path)
+    sound = _scale_sound(base, volume)
+    with _sound_cache_lock:
+        _sound_cache[path] = (stamp, volume, sound, base)
+        _sound_cache.move_to_end(path)
+        while len(_sound_cache) > SOUND_CACHE_SIZE:
+            _sound_cache.popitem(last=False)
+    return sound
+
+
+@dataclass
+class SoundEntry:
+    """One soundboard entry. Slotted, since a large board holds hundreds of these."""
+    __slots__ = ("name", "folder", "files", "volume", "key")
+
+    name: str
+    folder: str
+    files: list
+    volume: float
+    key: str
 
 
 class SoundboardApp:
@@ -20,16 +202,34 @@ class SoundboardApp:
         self.master.geometry("800x500")
         self.master.resizable(False, False)
 
-        try:
-            pygame.mixer.quit()
-        except Exception:
-            pass
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        self.mixer_buffer = self._read_mixer_buffer()
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=self.mixer_buffer)
+        pygame.mixer.init()
+        pygame.mixer.set_num_channels(MIXER_CHANNELS)
+        self._channels = [pygame.mixer.Channel(i) for i in range(MIXER_CHANNELS)]
+        self._next_channel = itertools.cycle(self._channels).__next__
+        self._warm_mixer()
         print("Pygame mixer initialized:", pygame.mixer.get_init())
 
         self.sounds = {}
-
-        self.hotkey_handles = {}
+        self.playback_state = {}
+        self._size_index = None
+        self._digests = {}
+
+        self.hotkey_bindings = {}
+        self.key_to_sound_id = {}
+        self._hotkey_map = {}
+        self._held_keys = set()
+        self._last_saved_hash = None
+
+        self._preload_pool = ThreadPoolExecutor(max_workers=PRELOAD_WORKERS, thread_name_prefix="preload")
+        self._trigger_q = queue.SimpleQueue()
+        self._error_q = queue.SimpleQueue()
+        threading.Thread(target=self._audio_worker, daemon=True).start()
+        self.master.after(200, self._poll_playback_errors)
+        self.master.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._key_to_codes = self._install_key_hook()
+        self._modifier_codes = self._resolve_modifier_codes()
 
         if not os.path.exists(SOUNDS_FOLDER):
             os.makedirs(SOUNDS_FOLDER)
@@ -49,6 +249,7 @@ class SoundboardApp:
 
         btn_frame = tk.Frame(master)
         btn_frame.pack(pady=5)
+        self.btn_frame = btn_frame
 
         tk.Button(btn_frame, text="Add Sound", command=self.add_sound, width=12).grid(row=0, column=0, padx=5)
         tk.Button(btn_frame, text="Add Variations", command=self.add_variations, width=12).grid(row=0, column=1, padx=5)
@@ -58,30 +259,287 @@ class SoundboardApp:
         tk.Button(btn_frame, text="Save Config", command=self.save_config, width=12).grid(row=2, column=0, padx=5, pady=5)
         tk.Button(btn_frame, text="Load Config", command=self.load_config, width=12).grid(row=2, column=1, padx=5, pady=5)
 
+        self.status = tk.Label(master, anchor="w")
+        self.status.pack(fill="x", padx=10)
+        self._flash_after = None
+
         if os.path.exists(CONFIG_FILE):
             self.load_config()
 
+    def _on_close(self):
+        """Drop queued preloads so their non-daemon worker threads don't hold up interpreter exit."""
+        self._preload_pool.shutdown(wait=False, cancel_futures=True)
+        self.master.destroy()
+
+    def _flash(self, msg):
+        """Show a transient message in the status bar instead of a modal popup."""
+        if self._flash_after is not None:
+            self.master.after_cancel(self._flash_after)
+        self.status.config(text=msg.replace("\n", " "))
+        self._flash_after = self.master.after(2500, self._clear_flash)
+
+    def _clear_flash(self):
+        self._flash_after = None
+        self.status.config(text="")
+
+    def _warm_mixer(self, timeout=0.25):
+        """Play a short silent buffer so the audio device is open before the first hotkey press."""
+        try:
+            channel = pygame.mixer.Sound(buffer=b'\x00\x00' * 64).play()
+        except Exception as e:
+            print(f"Could not warm up mixer: {e}")
+            return
+        deadline = time.monotonic() + timeout
+        while channel is not None and channel.get_busy() and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def _read_mixer_buffer(self):
+        """Read the mixer buffer size from the config file, falling back to the default."""
+        try:
+            with open(CONFIG_FILE, "rb") as f:
+                loaded = _json_loads(f.read())
+            if isinstance(loaded, dict):
+                return int(loaded.get("mixer_buffer", DEFAULT_MIXER_BUFFER))
+        except Exception:
+            pass
+        return DEFAULT_MIXER_BUFFER
+
     def _sanitize_folder_name(self, name):
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, '_')
-        return name.strip()
+        return name.translate(_SANITIZE_TABLE).strip()
 
     def _generate_sound_id(self, base_name):
         return f"{self._sanitize_folder_name(base_name)}_{uuid.uuid4().hex[:8]}"
 
+    def _unique_dest(self, folder, filename, existing):
+        """Pick a destination path in folder that isn't in existing (a set of casefolded basenames) and reserve it.
+
+        Names are compared casefolded so 'Boom.wav' and 'boom.wav' clash, as they do on Windows and macOS.
+        """
+        chosen = filename
+        if chosen.casefold() in existing:
+            name_part, ext = os.path.splitext(filename)
+            counter = 1
+            while chosen.casefold() in existing:
+                chosen = f"{name_part}_{counter}{ext}"
+                counter += 1
+        existing.add(chosen.casefold())
+        return f"{folder}{os.sep}{chosen}"
+
+    def _normalize_hotkey(self, key):
+        """Canonicalize user input like ' Shift + CTRL+1' to 'ctrl+shift+1' so equal hotkeys compare equal."""
+        parts = [_MODIFIER_ALIASES.get(part, part) for part in (p.strip() for p in key.lower().split("+"))]
+        modifiers = set(parts[:-1])
+        ordered = [m for m in HOTKEY_MODIFIERS if m in modifiers] + sorted(modifiers.difference(HOTKEY_MODIFIERS))
+        return "+".join(ordered + [parts[-1]])
+
+    def _find_stored_copy(self, src, size):
+        """Return a stored file with the same content as src, hashing only stored files of the same size."""
+        if self._size_index is None:
+            self._size_index = {}
+            for entry in self.sounds.values():
+                for path in entry.files:
+                    try:
+                        self._size_index.setdefault(os.path.getsize(path), []).append(path)
+                    except OSError:
+                        pass
+
+        candidates = self._size_index.get(size)
+        if not candidates:
+            return None
+        digest = _file_digest(src)
+        for path in candidates:
+            if path not in self._digests:
+                try:
+                    self._digests[path] = _file_digest(path)
+                except OSError:
+                    continue
+            if self._digests[path] == digest and os.path.exists(path):
+                return path
+        return None
+
+    def _store_file(self, src, dest):
+        """Copy src to dest, hardlinking to an existing copy when the same content is already stored."""
+        size = os.path.getsize(src)
+        existing = self._find_stored_copy(src, size)
+        linked = False
+        if existing:
+            try:
+                os.link(existing, dest)
+                linked = True
+            except PermissionError:
+                pass
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+        if not linked:
+            # Reserve dest exclusively so a clash raises FileExistsError instead of overwriting it.
+            open(dest, "xb").close()
+            shutil.copyfile(src, dest)
+        self._size_index.setdefault(size, []).append(dest)
+
+    def _parse_hotkey(self, key):
+        """Resolve a normalized hotkey like 'ctrl+shift+1' into (trigger scan codes, required, allowed).
+
+        The last key fires the hotkey. Every earlier key (a modifier or any other key, as in
+        'left ctrl+a' or 'a+b') becomes a required group of scan codes, one of which must be held.
+        allowed holds every scan code the hotkey names, so other held modifiers block it.
+        Raises ValueError for unknown keys, for multi-step hotkeys and when no key hook is installed.
+        """
+        if self._key_to_codes is None:
+            raise ValueError("Hotkeys are unavailable: no keyboard hook could be installed")
+        if "," in key:
+            raise ValueError(f"Multi-step hotkeys are not supported: '{key}'")
+        parts = key.split("+")
+        required = tuple(frozenset(self._key_to_codes(part)) for part in parts[:-1])
+        trigger_codes = frozenset(self._key_to_codes(parts[-1]))
+        return trigger_codes, required, trigger_codes.union(*required)
+
+    def _resolve_modifier_codes(self):
+        """Scan codes of every modifier key, used to reject presses with extra modifiers held."""
+        codes = set()
+        if self._key_to_codes is None:
+            return frozenset(codes)
+        for name in HOTKEY_MODIFIERS:
+            for variant in (name, f"left {name}", f"right {name}"):
+                try:
+                    codes.update(self._key_to_codes(variant))
+                except ValueError:
+                    pass
+        return frozenset(codes)
+
+    def _install_key_hook(self):
+        """Install the single global key hook, preferring a native OS hook over the keyboard library's.
+
+        Returns the key-name-to-scan-codes lookup matching the installed hook, or None when no hook
+        could be installed (the keyboard library needs root on Linux); sounds then load unbound.
+        """
+        if sys.platform == "win32":
+            ready = threading.Event()
+            result = []
+            threading.Thread(target=self._run_win32_hook, args=(ready, result), daemon=True).start()
+            if ready.wait(2.0) and result and result[0] is None:
+                return keyboard.key_to_scan_codes
+            print(f"Could not install Win32 keyboard hook: {result[0] if result else 'timed out'}")
+        elif evdev is not None:
+            devices = []
+            try:
+                for path in evdev.list_devices():
+                    device = evdev.InputDevice(path)
+                    if evdev.ecodes.KEY_A in device.capabilities().get(evdev.ecodes.EV_KEY, []):
+                        devices.append(device)
+            except OSError as e:
+                print(f"Could not open input devices: {e}")
+            if devices:
+                for device in devices:
+                    threading.Thread(target=self._run_evdev_hook, args=(device,), daemon=True).start()
+                return _evdev_key_to_codes
+
+        try:
+            keyboard.hook(self._on_keyboard_event)
+        except Exception as e:
+            print(f"Hotkeys unavailable, could not install keyboard hook: {e}")
+            return None
+        return keyboard.key_to_scan_codes
+
+    def _run_win32_hook(self, ready, result):
+        """Run a WH_KEYBOARD_LL hook and its message loop; reports install success through result."""
+        import ctypes
+        from ctypes import wintypes
+
+        WH_KEYBOARD_LL = 13
+        KEY_DOWN_MESSAGES = (0x0100, 0x0104)  # WM_KEYDOWN, WM_SYSKEYDOWN
+        KEY_UP_MESSAGES = (0x0101, 0x0105)  # WM_KEYUP, WM_SYSKEYUP
+        LRESULT = ctypes.c_ssize_t
+
+        class KBDLLHOOKSTRUCT(ctypes.Structure):
+            _fields_ = [("vkCode", wintypes.DWORD), ("scanCode", wintypes.DWORD), ("flags", wintypes.DWORD),
+                        ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+        HOOKPROC = ctypes.WINFUNCTYPE(LRESULT, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        user32.SetWindowsHookExW.argtypes = [ctypes.c_int, HOOKPROC, wintypes.HINSTANCE, wintypes.DWORD]
+        user32.SetWindowsHookExW.restype = wintypes.HHOOK
+        user32.CallNextHookEx.argtypes = [wintypes.HHOOK, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM]
+        user32.CallNextHookEx.restype = LRESULT
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+        held = self._held_keys
+
+        def proc(n_code, w_param, l_param):
+            if n_code == 0:
+                info = ctypes.cast(l_param, ctypes.POINTER(KBDLLHOOKSTRUCT)).contents
+                # keyboard names keys without a scan code by their negated virtual-key code.
+                scan_code = info.scanCode or -info.vkCode
+                if w_param in KEY_DOWN_MESSAGES:
+                    held.add(scan_code)
+                    self._dispatch_key_down(scan_code)
+                elif w_param in KEY_UP_MESSAGES:
+                    held.discard(scan_code)
+            return user32.CallNextHookEx(None, n_code, w_param, l_param)
+
+        callback = HOOKPROC(proc)
+        hook = user32.SetWindowsHookExW(WH_KEYBOARD_LL, callback, kernel32.GetModuleHandleW(None), 0)
+        result.append(None if hook else ctypes.WinError(ctypes.get_last_error()))
+        ready.set()
+        if not hook:
+            return
+
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+    def _run_evdev_hook(self, device):
+        """Read key events straight from an evdev device; hotkeys on this path are resolved with _evdev_key_to_codes."""
+        ev_key = evdev.ecodes.EV_KEY
+        held = self._held_keys
+        try:
+            for event in device.read_loop():
+                if event.type != ev_key:
+                    continue
+                if event.value:
+                    held.add(event.code)
+                    self._dispatch_key_down(event.code)
+                else:
+                    held.discard(event.code)
+        except OSError as e:
+            print(f"Stopped reading input device '{device.path}': {e}")
+
+    def _on_keyboard_event(self, event):
+        """keyboard library hook, used when no native hook is available."""
+        if event.event_type == keyboard.KEY_DOWN:
+            self._held_keys.add(event.scan_code)
+            self._dispatch_key_down(event.scan_code)
+        else:
+            self._held_keys.discard(event.scan_code)
+
+    def _dispatch_key_down(self, scan_code):
+        """Match a key press against the hotkeys it can fire and enqueue the first match for the audio worker.
+
+        Bindings are kept most-specific first, so 'a+b' wins over 'b' while 'a' is held.
+        """
+        bindings = self._hotkey_map.get(scan_code)
+        if not bindings:
+            return
+        held = self._held_keys
+        held_modifiers = self._modifier_codes.intersection(held)
+        for required, allowed, trigger in bindings:
+            if held_modifiers <= allowed and all(not group.isdisjoint(held) for group in required):
+                self._trigger_q.put_nowait(trigger)
+                return
+
     def _safe_remove_hotkey_by_key(self, key):
-        """Remove hotkey using the stored handler if possible."""
+        """Remove a hotkey's bindings from the dispatch map."""
         if not key:
             return
-        handle = self.hotkey_handles.pop(key, None)
-        try:
-            if handle is not None:
-                keyboard.remove_hotkey(handle)
+        trigger_codes, binding = self.hotkey_bindings.pop(key, ((), None))
+        for scan_code in trigger_codes:
+            remaining = tuple(b for b in self._hotkey_map.get(scan_code, ()) if b is not binding)
+            if remaining:
+                self._hotkey_map[scan_code] = remaining
             else:
-                keyboard.remove_hotkey(key)
-        except Exception:
-            pass
+                self._hotkey_map.pop(scan_code, None)
+        self.key_to_sound_id.pop(key, None)
 
     def add_sound(self):
         """Add a new sound with one or more audio file variations"""
@@ -100,7 +558,7 @@ class SoundboardApp:
             messagebox.showwarning("Invalid Key", "Hotkey cannot be empty.")
             return
 
-        key = key.lower().strip()
+        key = self._normalize_hotkey(key)
 
         folder_name = self._sanitize_folder_name(name)
         sound_folder = os.path.join(SOUNDS_FOLDER, folder_name)
@@ -112,51 +570,39 @@ class SoundboardApp:
         os.makedirs(sound_folder)
 
         copied_files = []
+        existing = {name.casefold() for name in os.listdir(sound_folder)}
         for filepath in filepaths:
-            filename = os.path.basename(filepath)
-            dest_path = os.path.join(sound_folder, filename)
-
-            counter = 1
-            while os.path.exists(dest_path):
-                name_part, ext = os.path.splitext(filename)
-                dest_path = os.path.join(sound_folder, f"{name_part}_{counter}{ext}")
-                counter += 1
-
-            shutil.copy2(filepath, dest_path)
+            dest_path = self._unique_dest(sound_folder, os.path.basename(filepath), existing)
+            self._store_file(filepath, dest_path)
             copied_files.append(dest_path)
 
         sound_id = self._generate_sound_id(name)
-        sound_entry = {
-            "name": name,
-            "folder": sound_folder,
-            "files": copied_files,
-            "volume": 1.0,
-            "key": "(unbound)"
-        }
+        sound_entry = SoundEntry(name=name, folder=sound_folder, files=copied_files, volume=1.0, key="(unbound)")
+
+        self.sounds[sound_id] = sound_entry
+        self.playback_state[sound_id] = [tuple(copied_files), len(copied_files), sound_entry.volume]
+        self._warm_sounds((path, sound_entry.volume) for path in copied_files)
 
         bound = False
         try:
-            if key in self.hotkey_handles:
+            if key in self.hotkey_bindings:
                 messagebox.showwarning("Key in Use", f"Hotkey '{key}' is already assigned. This sound will be unbound.")
             else:
-                handle = keyboard.add_hotkey(key, self.play_sound, args=(sound_id,))
-                self.hotkey_handles[key] = handle
-                sound_entry["key"] = key
+                self._bind_hotkey(key, sound_id)
+                sound_entry.key = key
                 bound = True
         except Exception as e:
             print(f"Could not bind hotkey '{key}': {e}")
             messagebox.showwarning("Hotkey Error", f"Could not bind hotkey '{key}'. Sound was added but unbound.")
 
-        self.sounds[sound_id] = sound_entry
-        display_key = sound_entry["key"]
+        display_key = sound_entry.key
         self.tree.insert("", "end", iid=sound_id,
-                         values=(name, display_key, int(sound_entry["volume"] * 100), f"{len(copied_files)} variation(s)"))
+                         values=(name, display_key, int(sound_entry.volume * 100), f"{len(copied_files)} variation(s)"))
 
         if bound:
-            messagebox.showinfo("Hotkey Assigned",
-                                f"{name} is now bound to [{display_key.upper()}]\n{len(copied_files)} variation(s) added")
+            self._flash(f"{name} is now bound to [{display_key.upper()}], {len(copied_files)} variation(s) added")
         else:
-            messagebox.showinfo("Sound Added", f"{name} added without a keybind.\nYou can edit the keybind later.")
+            self._flash(f"{name} added without a keybind. You can edit the keybind later.")
 
     def add_variations(self):
         """Add more audio file variations to an existing sound"""
@@ -176,59 +622,96 @@ class SoundboardApp:
             return
 
         sound_data = self.sounds[item]
-        sound_folder = sound_data["folder"]
+        sound_folder = sound_data.folder
 
+        new_files = []
+        existing = {name.casefold() for name in os.listdir(sound_folder)}
         for filepath in filepaths:
-            filename = os.path.basename(filepath)
-            dest_path = os.path.join(sound_folder, filename)
-
-            counter = 1
-            while os.path.exists(dest_path):
-                name_part, ext = os.path.splitext(filename)
-                dest_path = os.path.join(sound_folder, f"{name_part}_{counter}{ext}")
-                counter += 1
-
-            shutil.copy2(filepath, dest_path)
-            sound_data["files"].append(dest_path)
-
+            dest_path = self._unique_dest(sound_folder, os.path.basename(filepath), existing)
+            self._store_file(filepath, dest_path)
+            new_files.append(dest_path)
+        sound_data.files.extend(new_files)
+
+        state = self.playback_state[item]
+        state[0:2] = [state[0] + tuple(new_files), state[1] + len(new_files)]
+        self._warm_sounds((path, sound_data.volume) for path in new_files)
         self.update_tree_item(item)
-        messagebox.showinfo("Variations Added",
-                            f"Added {len(filepaths)} variation(s)\nTotal: {len(sound_data['files'])}")
+        self._flash(f"Added {len(filepaths)} variation(s). Total: {len(sound_data.files)}")
 
-    def play_sound(self, sound_id):
-        """Play a random variation of the sound. This can be called from a keyboard callback thread."""
-        sound_data = self.sounds.get(sound_id)
-        if not sound_data or not sound_data.get("files"):
-            return
+    def _warm_sounds(self, items):
+        """Decode (path, volume) pairs into the sound cache on the preload pool so first triggers hit the cache.
 
-        sound_file = random.choice(sound_data["files"])
+        The cache holds one entry per path, so only the first SOUND_CACHE_SIZE pairs are queued;
+        anything past that would just evict the earlier ones.
+        """
+        for path, volume in itertools.islice(items, SOUND_CACHE_SIZE):
+            self._preload_pool.submit(self._warm_sound, path, volume)
 
+    def _warm_sound(self, path, volume):
         try:
-            if not os.path.exists(sound_file):
-                print(f"Error: Sound file not found: {sound_file}")
+            _forget_stale_sound(path)
+            _get_sound(path, volume)
+        except (FileNotFoundError, pygame.error) as e:
+            print(f"Could not decode sound file '{path}': {e}")
+
+    def _audio_worker(self):
+        """Run queued triggers so mixer calls never block the keyboard hook thread."""
+        while True:
+            trigger = self._trigger_q.get()
+            trigger()
+
+    def _poll_playback_errors(self):
+        """Show errors reported by the audio worker; Tk calls must stay on the main thread."""
+        try:
+            while True:
+                messagebox.showerror("Playback Error", self._error_q.get_nowait())
+        except queue.Empty:
+            pass
+        self.master.after(200, self._poll_playback_errors)
+
+    def _bind_hotkey(self, key, sound_id):
+        """Map a hotkey to the sound's trigger in the dispatch map; raises ValueError for unknown keys."""
+        trigger_codes, required, allowed = self._parse_hotkey(key)
+        binding = (required, allowed, self._make_trigger(sound_id))
+        for scan_code in trigger_codes:
+            bindings = self._hotkey_map.get(scan_code, ()) + (binding,)
+            self._hotkey_map[scan_code] = tuple(sorted(bindings, key=lambda b: len(b[0]), reverse=True))
+        self.hotkey_bindings[key] = (trigger_codes, binding)
+        self.key_to_sound_id[key] = sound_id
+
+    def _make_trigger(self, sound_id):
+        """Build the playback callback for a sound. The callback runs on the audio worker thread.
+
+        It captures the sound's playback state box ([files, file count, volume]), so adding
+        variations or changing the volume updates it in place without rebinding the hotkey.
+        """
+        sound_name = self.sounds[sound_id].name
+        state = self.playback_state[sound_id]
+        find_channel = pygame.mixer.find_channel
+        next_channel = self._next_channel
+        get_sound = _get_sound
+        randrange = random.Random().randrange
+
+        def trigger():
+            files, n, volume = state
+            if not n:
                 return
 
-            file_ext = os.path.splitext(sound_file)[1].lower()
-            if file_ext == '.mp3':
-                pygame.mixer.music.load(sound_file)
-                pygame.mixer.music.set_volume(sound_data["volume"])
-                pygame.mixer.music.play()
-            else:
-                sound = pygame.mixer.Sound(sound_file)
-                sound.set_volume(sound_data["volume"])
-                sound.play()
+            sound_file = files[randrange(n)] if n > 1 else files[0]
+            try:
+                # Prefer an idle channel; only reuse (and cut off) the oldest one when all are busy.
+                (find_channel() or next_channel()).play(get_sound(sound_file, volume))
 
-            filename = os.path.basename(sound_file)
-            print(f"▶ Playing: {sound_data['name']} ({filename}) at volume {int(sound_data['volume']*100)}%")
-        except Exception as e:
-            print(f"Error playing sound '{sound_data.get('name', sound_id)}': {e}")
+                filename = os.path.basename(sound_file)
+                print(f"▶ Playing: {sound_name} ({filename}) at volume {int(volume*100)}%")
+            except FileNotFoundError:
+                print(f"Error: Sound file not found: {sound_file}")
+                self._error_q.put_nowait(f"Could not play {sound_name}: file not found: {sound_file}")
+            except Exception as e:
+                print(f"Error playing sound '{sound_name}': {e}")
+                self._error_q.put_nowait(f"Could not play {sound_name}: {e}")
 
-            def _show_err():
-                messagebox.showerror("Playback Error", f"Could not play {sound_data.get('name', sound_id)}: {e}")
-            try:
-                self.master.after(0, _show_err)
-            except Exception:
-                pass
+        return trigger
 
     def remove_sound(self):
         """Remove selected sound(s) and delete their folders"""
@@ -251,14 +734,19 @@ class SoundboardApp:
                 continue
 
             sound_entry = self.sounds[item]
-            key = sound_entry.get("key")
+            key = sound_entry.key
             try:
-                folder_path = sound_entry.get("folder")
+                folder_path = sound_entry.folder
                 if folder_path and os.path.exists(folder_path):
                     shutil.rmtree(folder_path)
                     print(f"Deleted folder: {folder_path}")
             except Exception as e:
                 print(f"Could not delete folder: {e}")
+            # A new file can land at a removed path, so its cached digest and size must not be trusted.
+            for path in sound_entry.files:
+                self._digests.pop(path, None)
+            self._size_index = None
+            _forget_sounds(sound_entry.files)
 
             try:
                 if key and key != "(unbound)":
@@ -270,6 +758,7 @@ class SoundboardApp:
                 del self.sounds[item]
             except Exception:
                 pass
+            self.playback_state.pop(item, None)
             try:
                 self.tree.delete(item)
             except Exception:
@@ -281,15 +770,25 @@ class SoundboardApp:
             to_save = []
             for sid, data in self.sounds.items():
                 to_save.append({
-                    "name": data.get("name"),
-                    "folder": data.get("folder"),
-                    "files": data.get("files"),
-                    "volume": data.get("volume"),
-                    "key": data.get("key") if data.get("key") != "(unbound)" else None
+                    "id": sid,
+                    "name": data.name,
+                    "folder": data.folder,
+                    "files": data.files,
+                    "volume": data.volume,
+                    "key": data.key if data.key != "(unbound)" else None
                 })
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(to_save, f, indent=4)
-            messagebox.showinfo("Saved", "Soundboard configuration saved!")
+            payload = _json_dumps({"mixer_buffer": self.mixer_buffer, "sounds": to_save})
+            payload_hash = hash(payload)
+            if payload_hash == self._last_saved_hash and os.path.exists(CONFIG_FILE):
+                self._flash("Soundboard configuration is already saved.")
+                return
+
+            tmp_file = CONFIG_FILE + ".tmp"
+            with open(tmp_file, "wb", buffering=1 << 16) as f:
+                f.write(payload)
+            os.replace(tmp_file, CONFIG_FILE)
+            self._last_saved_hash = payload_hash
+            self._flash("Soundboard configuration saved!")
         except Exception as e:
             messagebox.showerror("Save Error", f"Could not save configuration: {e}")
 
@@ -300,81 +799,103 @@ class SoundboardApp:
             return
 
         try:
-            with open(CONFIG_FILE, "r") as f:
-                loaded = json.load(f)
+            with open(CONFIG_FILE, "rb") as f:
+                loaded = _json_loads(f.read())
         except Exception as e:
             messagebox.showerror("Load Error", f"Could not read config file: {e}")
             return
 
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        if isinstance(loaded, dict):
+            loaded = loaded.get("sounds", [])
 
-        for k in list(self.hotkey_handles.keys()):
-            try:
-                self._safe_remove_hotkey_by_key(k)
-            except Exception:
-                pass
-        self.hotkey_handles.clear()
+        existing_rows = set(self.tree.get_children())
+
+        self.hotkey_bindings.clear()
+        self.key_to_sound_id.clear()
+        self._hotkey_map.clear()
         self.sounds.clear()
+        self.playback_state.clear()
+        self._size_index = None
+        self._digests.clear()
 
         failed_keys = []
+        rows = []
+        to_warm = []
 
         for entry in loaded:
             name = entry.get("name", "Unnamed")
             folder = entry.get("folder")
-            files = entry.get("files", []) or []
+            files = list(entry.get("files", []) or [])
+            # Missing files stay in the entry so saving doesn't drop them, e.g. from an unmounted drive.
+            playable = []
+            for path in files:
+                if not os.path.isfile(path):
+                    print(f"Skipping missing sound file '{path}' for '{name}'")
+                    continue
+                playable.append(path)
             volume = float(entry.get("volume", 1.0))
             key = entry.get("key")
             if key:
-                key = key.lower().strip()
+                key = self._normalize_hotkey(key)
 
-            sound_id = self._generate_sound_id(name)
-            sound_entry = {
-                "name": name,
-                "folder": folder,
-                "files": files,
-                "volume": volume,
-                "key": "(unbound)"
-            }
+            sound_id = entry.get("id")
+            if not sound_id or sound_id in self.sounds:
+                sound_id = self._generate_sound_id(name)
+            sound_entry = SoundEntry(name=name, folder=folder, files=files, volume=volume, key="(unbound)")
+
+            self.sounds[sound_id] = sound_entry
+            self.playback_state[sound_id] = [tuple(playable), len(playable), volume]
+            to_warm.extend((path, volume) for path in playable)
 
             if key:
                 try:
-                    handle = keyboard.add_hotkey(key, self.play_sound, args=(sound_id,))
-                    self.hotkey_handles[key] = handle
-                    sound_entry["key"] = key
+                    self._bind_hotkey(key, sound_id)
+                    sound_entry.key = key
                 except Exception as e:
                     print(f"Could not bind hotkey '{key}' for '{name}': {e}")
                     failed_keys.append(f"{name} ({key})")
-                    sound_entry["key"] = "(unbound)"
+                    sound_entry.key = "(unbound)"
 
-            self.sounds[sound_id] = sound_entry
-            display_key = sound_entry["key"]
-            self.tree.insert("", "end", iid=sound_id,
-                             values=(name, display_key, int(volume * 100), f"{len(files)} variation(s)"))
+            display_key = sound_entry.key
+            rows.append((sound_id, (name, display_key, int(volume * 100), f"{len(files)} variation(s)")))
+
+        # Only touch rows that changed, with the tree unpacked so Tk lays it out once.
+        self.tree.pack_forget()
+        try:
+            stale_rows = existing_rows.difference(self.sounds)
+            if stale_rows:
+                self.tree.delete(*stale_rows)
+            for index, (sound_id, values) in enumerate(rows):
+                if sound_id in existing_rows:
+                    self.tree.item(sound_id, values=values)
+                    self.tree.move(sound_id, "", index)
+                else:
+                    self.tree.insert("", index, iid=sound_id, values=values)
+        finally:
+            self.tree.pack(fill="both", expand=True, padx=10, pady=10, before=self.btn_frame)
+
+        self._warm_sounds(to_warm)
 
         success_msg = f"Loaded {len(self.sounds)} sound(s)!"
         if failed_keys:
             success_msg += f"\n\nFailed to load {len(failed_keys)} keybind(s):\n" + "\n".join(failed_keys)
             success_msg += "\n\nThese sounds were loaded but unbound. Please check the keybinds."
-
-        messagebox.showinfo("Loaded", success_msg)
+            messagebox.showwarning("Loaded", success_msg)
+        else:
+            self._flash(success_msg)
 
     def update_tree_item(self, sound_id):
         """Update a tree item with current sound data"""
         if sound_id not in self.sounds:
             return
         sound_data = self.sounds[sound_id]
-        volume_percent = int(sound_data["volume"] * 100)
-        file_count = len(sound_data["files"])
+        values = (sound_data.name, sound_data.key, int(sound_data.volume * 100),
+                  f"{len(sound_data.files)} variation(s)")
         try:
-            self.tree.set(sound_id, "Name", sound_data["name"])
-            self.tree.set(sound_id, "Key", sound_data["key"])
-            self.tree.set(sound_id, "Volume", volume_percent)
-            self.tree.set(sound_id, "Files", f"{file_count} variation(s)")
+            self.tree.item(sound_id, values=values)
         except Exception:
             try:
-                self.tree.insert("", "end", iid=sound_id,
-                                 values=(sound_data["name"], sound_data["key"], volume_percent, f"{file_count} variation(s)"))
+                self.tree.insert("", "end", iid=sound_id, values=values)
             except Exception:
                 pass
 
@@ -391,16 +912,16 @@ class SoundboardApp:
             return
 
         sound_data = self.sounds[item]
-        current_volume = int(sound_data["volume"] * 100)
+        current_volume = int(sound_data.volume * 100)
 
         volume_window = tk.Toplevel(self.master)
-        volume_window.title(f"Adjust Volume - {sound_data['name']}")
+        volume_window.title(f"Adjust Volume - {sound_data.name}")
         volume_window.geometry("350x150")
         volume_window.resizable(False, False)
         volume_window.transient(self.master)
         volume_window.grab_set()
 
-        tk.Label(volume_window, text=f"Adjust volume for: {sound_data['name']}", font=("Arial", 10, "bold")).pack(pady=10)
+        tk.Label(volume_window, text=f"Adjust volume for: {sound_data.name}", font=("Arial", 10, "bold")).pack(pady=10)
 
         volume_var = tk.IntVar(value=current_volume)
         volume_label = tk.Label(volume_window, text=f"Volume: {current_volume}%", font=("Arial", 10))
@@ -415,9 +936,11 @@ class SoundboardApp:
 
         def apply_volume():
             new_volume = volume_var.get()
-            sound_data["volume"] = new_volume / 100
+            sound_data.volume = new_volume / 100
+            self.playback_state[item][2] = sound_data.volume
+            self._warm_sounds((path, sound_data.volume) for path in sound_data.files)
             self.update_tree_item(item)
-            messagebox.showinfo("Volume Updated", f"Volume set to {new_volume}%")
+            self._flash(f"Volume set to {new_volume}%")
             volume_window.destroy()
 
         tk.Button(volume_window, text="Apply", command=apply_volume, width=15).pack(pady=10)
@@ -435,40 +958,35 @@ class SoundboardApp:
             return
 
         sound_entry = self.sounds[item]
-        old_key = sound_entry.get("key")
+        old_key = sound_entry.key
         if old_key == "(unbound)":
             old_key_display = "(unbound)"
             old_key = None
         else:
             old_key_display = old_key
 
-        sound_name = sound_entry.get("name")
+        sound_name = sound_entry.name
 
         new_key = simpledialog.askstring("Edit Keybind",
                                          f"Enter new hotkey for '{sound_name}':\n(Current: {old_key_display})",
                                          initialvalue=old_key_display if old_key_display != "(unbound)" else "")
         if new_key is None:
             return
-        new_key = new_key.lower().strip()
+        new_key = self._normalize_hotkey(new_key)
         if new_key == "":
             if old_key:
                 self._safe_remove_hotkey_by_key(old_key)
-            sound_entry["key"] = "(unbound)"
+            sound_entry.key = "(unbound)"
             self.update_tree_item(item)
-            messagebox.showinfo("Key Unbound", f"'{sound_name}' is now unbound.")
+            self._flash(f"'{sound_name}' is now unbound.")
             return
 
         if new_key == old_key:
             return
 
-        conflicting_id = None
-        for sid, d in self.sounds.items():
-            if sid != item and d.get("key") and d.get("key") == new_key:
-                conflicting_id = sid
-                break
-
-        if conflicting_id is not None:
-            conflicting_name = self.sounds[conflicting_id]["name"]
+        conflicting_id = self.key_to_sound_id.get(new_key)
+        if conflicting_id is not None and conflicting_id != item:
+            conflicting_name = self.sounds[conflicting_id].name
             confirm = messagebox.askyesno("Keybind Conflict",
                                           f"'{new_key}' is already assigned to '{conflicting_name}'.\n\n"
                                           f"Remove it from '{conflicting_name}' and assign to '{sound_name}'?")
@@ -480,10 +998,9 @@ class SoundboardApp:
             except Exception:
                 pass
 
-            self.sounds[conflicting_id]["key"] = "(unbound)"
+            self.sounds[conflicting_id].key = "(unbound)"
             self.update_tree_item(conflicting_id)
-            messagebox.showinfo("Keybind Removed",
-                                f"Removed keybind from '{conflicting_name}'")
+            self._flash(f"Removed keybind from '{conflicting_name}'")
 
         if old_key:
             try:
@@ -492,14 +1009,12 @@ class SoundboardApp:
                 pass
 
         try:
-            handle = keyboard.add_hotkey(new_key, self.play_sound, args=(item,))
-            self.hotkey_handles[new_key] = handle
-            sound_entry["key"] = new_key
+            self._bind_hotkey(new_key, item)
+            sound_entry.key = new_key
             self.update_tree_item(item)
-            messagebox.showinfo("Keybind Updated",
-                                f"'{sound_name}' is now bound to [{new_key.upper()}]")
+            self._flash(f"'{sound_name}' is now bound to [{new_key.upper()}]")
         except Exception as e:
-            sound_entry["key"] = "(unbound)"
+            sound_entry.key = "(unbound)"
             self.update_tree_item(item)
             messagebox.showerror("Hotkey Error", f"Could not bind hotkey '{new_key}': {e}")
 